@@ -0,0 +1,62 @@
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Header
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from app.routers import records, search
+from app.services.records import close_upstream_client
+
+# INFO by default — the per-page payload dumps only happen under DEBUG.
+logging.basicConfig(level=logging.INFO)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The upstream client lives for the whole app so its keep-alive pool is
+    # reused across requests; drain it cleanly on shutdown.
+    yield
+    await close_upstream_client()
+
+app = FastAPI(
+    lifespan=lifespan,
+    title="LUAN – Infracredit AI Lesson Learnt API",
+    description="FastAPI backend for fetching and searching Lesson Learnt records.",
+    version="1.0.9",
+    # Large /records payloads serialize several times faster through orjson
+    # than the stdlib json encoder.
+    default_response_class=ORJSONResponse,
+)
+
+# ---------------------- CORS Configuration ----------------------
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+app.include_router(records.router)
+app.include_router(search.router)
+
+# ---------------------- Bot Welcome Message ----------------------
+def lesson_bot():
+    return {
+        "title": "Hi, I’m LUAN — Infracredit’s AI Lesson Learnt Bot.",
+        "intro": "Ask me things like:",
+        "examples": [
+            "→ Tell me all the Risk issues and mitigants for Counter-Party Pirano Energy",
+            "→ List all the Risk issues and mitigants for sector Clean Energy",
+            "→ Show me all the Risk issues and mitigants for Market Risk"
+        ]
+    }
+
+@app.get("/")
+async def root():
+    return {"message": "Welcome to LUAN — Infracredit’s AI Lesson Learnt API"}
+
+@app.get("/bot-welcome")
+async def bot_welcome(token: str = Header(..., description="User login token")):
+    """Return welcome message with examples."""
+    return {"welcome": lesson_bot()}
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.services.auth import verified_token
+from app.services.records import get_records_cached, public_record
+
+router = APIRouter()
+
+# response_model=None skips pydantic's per-item validation pass over what can
+# be thousands of already-shaped records.
+@router.get("/records", response_model=None)
+async def get_records(token: str = Depends(verified_token)):
+    """Fetch all records using user's token in header."""
+    records, _, _ = await get_records_cached(token)
+    if not records:
+        raise HTTPException(status_code=404, detail="No records found.")
+    return {"total": len(records), "records": [public_record(r) for r in records]}
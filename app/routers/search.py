@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from app.services.auth import verified_token
+from app.services.records import get_records_cached
+from app.utils.text import (
+    FUZZY_MATCH_THRESHOLD,
+    fuzzy_keyword_score,
+    keyword_matcher,
+    preprocess_query,
+)
+
+router = APIRouter()
+
+class SearchHit(BaseModel):
+    """Public shape of a search result; internal fields are dropped."""
+    model_config = ConfigDict(extra="ignore")
+
+    id: int | str | None = None
+    title: str = ""
+    details: str = ""
+    lessonLearnt: str = ""
+    typeDescription: str = ""
+    transactionName: str = ""
+    portfolioName: str = ""
+    sector: str = ""
+
+# TypeAdapter keeps validation + dump on pydantic's C-accelerated path.
+_SEARCH_HITS = TypeAdapter(list[SearchHit])
+
+@router.get("/search", response_model=None)
+async def search_records(
+    query: str = Query(..., description="Search by portfolio name, sector, project type, title, or description"),
+    token: str = Depends(verified_token)
+):
+    """Search transaction records by keywords across all fields."""
+    keywords = preprocess_query(query)
+    if not keywords:
+        raise HTTPException(status_code=400, detail="No valid keywords found in your query.")
+
+    records, blobs, index = await get_records_cached(token)
+
+    # Intersect the posting lists — one hash lookup per keyword instead of a
+    # substring scan over every record. Starting from the smallest list keeps
+    # the intersection work proportional to the rarest keyword, and an empty
+    # list short-circuits straight to the fallback.
+    posting_lists = sorted((index.get(k, set()) for k in keywords), key=len)
+    candidate_ids = set.intersection(*posting_lists) if posting_lists[0] else set()
+
+    if candidate_ids:
+        # Only the (typically few) candidates are touched from here on; rank
+        # them by how often the keywords appear in their text.
+        ranked = sorted(
+            candidate_ids,
+            key=lambda i: sum(blobs[i].count(k) for k in keywords),
+            reverse=True,
+        )
+        matches = [records[i] for i in ranked]
+    else:
+        # The index only matches whole words; fall back to the original
+        # substring semantics so partial keywords (e.g. "energ") still hit.
+        matches_all_keywords = keyword_matcher(set(keywords))
+        matches = [
+            records[i] for i, blob in enumerate(blobs)
+            if matches_all_keywords(blob)
+        ]
+
+        if not matches:
+            # Last resort: fuzzy match so typos ("Pirano Enrgy") still find
+            # the record. rapidfuzz is C++ so this stays cheap even when it
+            # has to score the whole list.
+            matches = [
+                records[i] for i, blob in enumerate(blobs)
+                if fuzzy_keyword_score(keywords, blob) >= FUZZY_MATCH_THRESHOLD
+            ]
+
+    if not matches:
+        return {"message": f"No records found for '{query}'"}
+
+    # SearchHit ignores extra keys, so the internal _search_blob is dropped
+    # here without a per-record copy.
+    results = _SEARCH_HITS.dump_python(_SEARCH_HITS.validate_python(matches), mode="json")
+
+    return {
+        "query": query,
+        "keywords": keywords,
+        "total_matches": len(matches),
+        "results": results
+    }
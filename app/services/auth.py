@@ -0,0 +1,48 @@
+import asyncio
+
+import jwt
+from cachetools import TTLCache
+from fastapi import Header, HTTPException
+
+from app.services.records import _token_cache_key
+from config import JWKS_URL
+
+# PyJWKClient caches the fetched JWKS itself, so key material is only
+# downloaded when the key set rotates.
+_jwks_client = jwt.PyJWKClient(JWKS_URL) if JWKS_URL else None
+
+# Hashes of recently verified tokens — the signature check runs at most once
+# per token per TTL window.
+_VERIFIED_CACHE = TTLCache(maxsize=1024, ttl=30)
+
+def _verify(token: str):
+    signing_key = _jwks_client.get_signing_key_from_jwt(token)
+    jwt.decode(
+        token,
+        signing_key.key,
+        algorithms=["RS256", "ES256"],
+        options={"verify_aud": False},
+    )
+
+async def verified_token(token: str = Header(..., description="Access token for authentication")):
+    """
+    FastAPI dependency: reject bad or expired JWTs locally, before any
+    upstream round trip. When no JWKS URL is configured the token passes
+    through untouched (upstream still authorizes every fetch).
+    """
+    if _jwks_client is None:
+        return token
+
+    key = _token_cache_key(token)
+    if key in _VERIFIED_CACHE:
+        return token
+
+    try:
+        # PyJWKClient fetches over blocking urllib on a key-cache miss — keep
+        # that off the event loop.
+        await asyncio.to_thread(_verify, token)
+    except jwt.PyJWTError as e:
+        raise HTTPException(status_code=401, detail=f"Invalid or expired token: {e}")
+
+    _VERIFIED_CACHE[key] = True
+    return token
@@ -0,0 +1,230 @@
+import asyncio
+import hashlib
+import logging
+from collections import defaultdict
+
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
+from fastapi import HTTPException
+
+from app.utils.text import _WORD_RE, clean_html, gather_text
+from config import BASE_URL, MAX_PAGES, PAGE_SIZE, RECORDS_ENDPOINT
+
+logger = logging.getLogger("luan")
+
+# Shared upstream client — keep-alive connections avoid a TCP/TLS handshake
+# per page fetch, and advertising compression shrinks page payloads (httpx
+# decompresses transparently). Everything that doesn't vary per request
+# (base URL, static headers, redirect policy) is set once here so each page
+# fetch only supplies auth.
+_client = httpx.AsyncClient(
+    base_url=BASE_URL,
+    timeout=20,
+    follow_redirects=False,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    headers={"Accept-Encoding": "gzip, br", "Content-Type": "application/json"},
+)
+
+async def close_upstream_client():
+    """Close the shared client's connection pool (app shutdown)."""
+    await _client.aclose()
+
+# Validators for conditional page fetches: (token_hash, page) -> (etag, data).
+# A 304 from upstream lets us reuse the parsed page without re-downloading it.
+_ETAG_CACHE = LRUCache(maxsize=1024)
+
+# Which auth header style upstream accepted for a token, so pages aren't
+# fetched twice just to rediscover it: token_hash -> "bearer" | "token".
+_AUTH_STYLE_CACHE = LRUCache(maxsize=1024)
+
+def _auth_headers(token: str, style: str):
+    if style == "token":
+        return {"token": token}
+    return {"Authorization": f"Bearer {token}"}
+
+# Cache the fully fetched + cleaned record list per token for 5 minutes so
+# repeated searches don't re-paginate the whole upstream API every time.
+RECORDS_CACHE = TTLCache(maxsize=128, ttl=300)
+_INFLIGHT_FETCHES = {}
+_CACHE_LOCK = asyncio.Lock()
+
+def _token_cache_key(token: str):
+    # Hash the token so raw credentials are never kept in the cache.
+    return hashlib.blake2b(token.encode()).hexdigest()
+
+def extract_records(data):
+    """
+    Recursively search for a list of dicts (records) in API response.
+    """
+    if isinstance(data, list):
+        if all(isinstance(i, dict) for i in data):
+            return data
+        return []
+    elif isinstance(data, dict):
+        for v in data.values():
+            result = extract_records(v)
+            if result:
+                return result
+    return []
+
+def slim_record(raw):
+    """Project a raw upstream record down to the fields the app serves."""
+    ct = raw.get("consultantTransaction") or {}
+    return {
+        "id": raw.get("id"),
+        "title": clean_html(raw.get("title", "")),
+        "details": clean_html(raw.get("details", "")),
+        "lessonLearnt": clean_html(raw.get("lessonLearnt", "")),
+        "typeDescription": clean_html(raw.get("typeDescription", "")),
+        "transactionName": ct.get("transactionName", ""),
+        "portfolioName": ct.get("portfolioName", ""),
+        "sector": ct.get("sector", ""),
+    }
+
+def record_blob(record):
+    """Return the record's flattened lowercased text, computing it once."""
+    blob = record.get("_search_blob")
+    if blob is None:
+        blob = " ".join(gather_text(record)).lower()
+        record["_search_blob"] = blob
+    return blob
+
+def public_record(record):
+    """Record as returned to clients, without internal underscore fields."""
+    return {k: v for k, v in record.items() if not k.startswith("_")}
+
+def build_search_index(records):
+    """
+    Build a word -> record-id inverted index over the records' text blobs,
+    so searching is a hash lookup instead of a scan per record.
+    """
+    blobs = []
+    index = defaultdict(set)
+    for i, r in enumerate(records):
+        blob = record_blob(r)
+        blobs.append(blob)
+        for w in _WORD_RE.findall(blob):
+            index[w].add(i)
+    return blobs, index
+
+async def _fetch_page(token: str, page: int):
+    """Fetch one page of records. Tries both 'token' and 'Authorization: Bearer <token>'."""
+    token_hash = _token_cache_key(token)
+    etag_key = (token_hash, page)
+    cached = _ETAG_CACHE.get(etag_key)
+
+    # Use the auth style that last worked for this token; only a rejection
+    # makes us probe the other one.
+    style = _AUTH_STYLE_CACHE.get(token_hash, "bearer")
+    styles = (style, "token" if style == "bearer" else "bearer")
+
+    response = None
+    for style in styles:
+        headers = _auth_headers(token, style)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        try:
+            response = await _client.get(
+                RECORDS_ENDPOINT,
+                params={"page": page, "pageSize": PAGE_SIZE},
+                headers=headers,
+            )
+        except Exception as e:
+            logger.warning("Page %d request failed (%s auth): %s", page, style, e)
+            continue
+        if response.status_code in (401, 403):
+            continue  # wrong auth style (or bad token) — try the other
+        _AUTH_STYLE_CACHE[token_hash] = style
+        break
+
+    if response is not None and response.status_code == 304:
+        # Page unchanged since we last saw it — reuse the parsed copy.
+        return cached[1]
+
+    if response is None or response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code if response else 500,
+            detail="Failed to fetch records. Token may be invalid or expired."
+        )
+
+    data = orjson.loads(response.content)
+    etag = response.headers.get("etag")
+    if etag:
+        _ETAG_CACHE[etag_key] = (etag, data)
+    # Lazy %-formatting: the repr of a full page never gets built unless
+    # DEBUG logging is actually enabled.
+    logger.debug("Raw API response (page %d): %s", page, data)
+    return data
+
+async def fetch_all_records(token: str):
+    """Fetch all pages of records concurrently using the user's token."""
+    data = await _fetch_page(token, 1)
+    results = extract_records(data)
+
+    # Try to get total pages if available
+    total_pages = 1
+    if isinstance(data, dict):
+        total_pages = data.get("totalPages") or data.get("total_pages") or 1
+    if total_pages > MAX_PAGES:
+        logger.warning("Upstream reports %d pages; capping fetch at %d", total_pages, MAX_PAGES)
+        total_pages = MAX_PAGES
+
+    # Pages 2..N don't depend on each other — fetch them all at once.
+    if results and total_pages > 1:
+        pages = await asyncio.gather(
+            *(_fetch_page(token, page) for page in range(2, total_pages + 1))
+        )
+        for page_data in pages:
+            results.extend(extract_records(page_data))
+
+    # Project each raw record down to the fields the API actually serves —
+    # upstream records carry plenty the app never reads — clean HTML, and
+    # flatten the text once at ingest so searches never redo this work.
+    results = [slim_record(r) for r in results]
+    for r in results:
+        record_blob(r)
+
+    logger.info("Total records fetched: %d", len(results))
+    if results:
+        logger.debug("Sample record keys: %s", results[0].keys())
+
+    return results
+
+async def get_records_cached(token: str):
+    """
+    Return (records, blobs, index) for this token, fetching (at most once) on
+    a miss. The text blobs and inverted index are built once per fetch so
+    searches don't re-flatten every record per query.
+    """
+    key = _token_cache_key(token)
+
+    async with _CACHE_LOCK:
+        if key in RECORDS_CACHE:
+            return RECORDS_CACHE[key]
+        future = _INFLIGHT_FETCHES.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            _INFLIGHT_FETCHES[key] = future
+            is_owner = True
+        else:
+            is_owner = False
+
+    if not is_owner:
+        # Another request is already fetching for this token — wait for it.
+        return await asyncio.shield(future)
+
+    try:
+        records = await fetch_all_records(token)
+        blobs, index = build_search_index(records)
+        entry = (records, blobs, index)
+        async with _CACHE_LOCK:
+            RECORDS_CACHE[key] = entry
+        future.set_result(entry)
+        return entry
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        async with _CACHE_LOCK:
+            _INFLIGHT_FETCHES.pop(key, None)
@@ -0,0 +1,105 @@
+import re
+
+from rapidfuzz import fuzz
+
+try:
+    import ahocorasick
+except ImportError:  # optional — the regex alternation is used instead
+    ahocorasick = None
+
+# Compiled once at import — clean_html runs per field per record, so avoid
+# re-resolving the patterns on every call. [^>]* also skips the lazy-quantifier
+# backtracking that <.*?> pays.
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+_WORD_RE = re.compile(r"\w+")
+
+_STOPWORDS = frozenset({
+    "show", "me", "all", "the", "lessons", "learnt", "about", "in", "for",
+    "mitigant", "mitigants", "risk", "issues", "record", "records", "lesson",
+    "please", "can", "you", "display", "client", "sector", "counter-party",
+    "counter", "party", "tell", "give", "list"
+})
+
+# Minimum average fuzzy score (0-100) for a record to count as a fuzzy hit.
+FUZZY_MATCH_THRESHOLD = 60
+
+def preprocess_query(query: str):
+    query = query.lower()
+    return [w for w in _WORD_RE.findall(query) if len(w) > 2 and w not in _STOPWORDS]
+
+def clean_html(raw_text):
+    if not isinstance(raw_text, str):
+        return raw_text
+    return _HTML_TAG_RE.sub("", raw_text).strip()
+
+def gather_text(root):
+    """Gather all strings from nested dicts/lists with an explicit stack —
+    no Python call frame per node, and `type(...) is` skips the MRO walk
+    that isinstance pays."""
+    texts = []
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        t = type(d)
+        if t is str:
+            texts.append(d)
+        elif t is dict:
+            stack.extend(d.values())
+        elif t is list:
+            stack.extend(d)
+    return texts
+
+def blob_has_all_keywords(blob, keyword_set, pattern):
+    """
+    True if every keyword occurs in the blob. `pattern` is the compiled
+    alternation of the keywords, so the blob is scanned once for all of them
+    instead of once per keyword.
+    """
+    seen = {m.group() for m in pattern.finditer(blob)}
+    if len(seen) == len(keyword_set):
+        return True
+    # Keywords that overlap in the blob can mask each other within a single
+    # scan — recheck only the stragglers.
+    return all(k in blob for k in keyword_set - seen)
+
+def keyword_matcher(keyword_set):
+    """
+    Return a blob -> bool predicate that is True when every keyword occurs in
+    the blob. With pyahocorasick installed, all keywords are compiled into one
+    automaton and each blob is scanned in a single DFA pass (which also
+    reports overlapping occurrences exactly); otherwise the compiled regex
+    alternation is used.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for k in keyword_set:
+            automaton.add_word(k, k)
+        automaton.make_automaton()
+        wanted = len(keyword_set)
+
+        def matches(blob):
+            seen = set()
+            for _, k in automaton.iter(blob):
+                seen.add(k)
+                if len(seen) == wanted:
+                    return True
+            return False
+
+        return matches
+
+    pattern = re.compile("|".join(map(re.escape, keyword_set)))
+    return lambda blob: blob_has_all_keywords(blob, keyword_set, pattern)
+
+def fuzzy_keyword_score(keywords, blob):
+    """
+    Average partial_ratio of the keywords against the blob, bailing out early
+    once the threshold is out of reach even if the remaining keywords were
+    perfect matches.
+    """
+    total = 0.0
+    for i, k in enumerate(keywords):
+        total += fuzz.partial_ratio(k, blob)
+        best_possible = (total + 100.0 * (len(keywords) - i - 1)) / len(keywords)
+        if best_possible < FUZZY_MATCH_THRESHOLD:
+            return 0.0
+    return total / len(keywords)
@@ -1,6 +1,17 @@
 # ---------------------- API Configuration ----------------------
 
+import os
+
 #Base URL for your Azure backend
 BASE_URL = "https://sysprosystembackend-develop-hybyc7adhkh4cgfy.eastus-01.azurewebsites.net"
-RECORDS_ENDPOINT = "/api/v1/Transactions" 
+RECORDS_ENDPOINT = "/api/v1/Transactions"
+
+# Upstream pagination tuning — bigger pages mean fewer round trips, and the
+# page cap keeps a bogus totalPages value from fanning out unbounded fetches.
+PAGE_SIZE = int(os.getenv("LUAN_PAGE_SIZE", "200"))
+MAX_PAGES = int(os.getenv("LUAN_MAX_PAGES", "50"))
+
+# JWKS endpoint for verifying bearer tokens locally before any upstream I/O.
+# Leave empty to pass tokens straight through (upstream still authorizes).
+JWKS_URL = os.getenv("LUAN_JWKS_URL", "")
 